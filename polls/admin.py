@@ -1,14 +1,51 @@
 from django.contrib import admin
+from django.db.models.query import QuerySet
+from django.utils.translation import get_language
 from modeltranslation.admin import TranslationAdmin
+from modeltranslation.translator import translator
+from modeltranslation.utils import build_localized_fieldname
 from .models import Question,Choice
 # admin.site.register([Question,Choice])
 
+def active_language_fields(model):
+      """
+      The names of the model's untranslated columns plus the translation
+      columns of the active language, for use with .only(). modeltranslation
+      adds one column per language for every translated field, and the
+      changelist only ever displays the active language.
+      """
+      options = translator.get_options_for_model(model)
+      translation_columns = {column.name
+                             for columns in options.fields.values()
+                             for column in columns}
+      language = get_language()
+      fields = [field.name for field in model._meta.concrete_fields
+                if field.name not in translation_columns]
+      fields += [build_localized_fieldname(name, language) for name in options.fields]
+      return fields
+
+
+def only_active_language(queryset, model):
+      """
+      Apply .only() with the active language's columns. Goes through the plain
+      QuerySet method because MultilingualQuerySet.only() expands every field
+      back to all of its language columns, which is what we are avoiding.
+      """
+      return QuerySet.only(queryset, *active_language_fields(model))
+
+
 class QuestionAdmin(TranslationAdmin):
       model=Question
 
+      def get_queryset(self, request):
+           return only_active_language(super().get_queryset(request), self.model)
+
 
 class ChoiceAdmin(TranslationAdmin):
       model=Choice
 
+      def get_queryset(self, request):
+           return only_active_language(super().get_queryset(request), self.model)
+
 admin.site.register(Question, QuestionAdmin)
-admin.site.register(Choice, ChoiceAdmin)
\ No newline at end of file
+admin.site.register(Choice, ChoiceAdmin)
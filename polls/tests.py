@@ -1,3 +1,17 @@
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Choice, Question
 
 # Create your tests here.
+
+class IndexViewTests(TestCase):
+      def test_index_prefetches_choices(self):
+           for i in range(3):
+                question = Question.objects.create(question_text='Question %s' % i, pub_date=timezone.now())
+                Choice.objects.create(question=question, choice_text='Choice %s' % i)
+           # one query for the questions, one IN (...) query for all their choices
+           with self.assertNumQueries(2):
+                response = self.client.get(reverse('polls:index'))
+           self.assertEqual(response.status_code, 200)
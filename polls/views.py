@@ -8,6 +8,7 @@ from django.shortcuts import get_object_or_404, render
 
 from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404, render
+from django.db.models import Prefetch
 from django.urls import reverse
 from django.views import generic
 from django.http import HttpResponse
@@ -19,8 +20,8 @@ class IndexView(generic.ListView):
       context_object_name = 'latest_question_list'
       context = {'available_languages': ['en', 'es', 'fr']}
       def get_queryset(self):
-           return Question.objects.order_by('-pub_date')[:5]
-           return (context)
+           return Question.objects.order_by('-pub_date').prefetch_related(
+                Prefetch('choice_set', queryset=Choice.objects.only('id', 'question_id', 'choice_text')))[:5]
 class DetailView(generic.DetailView):
       model = Question
       template_name = 'polls/detail.html'
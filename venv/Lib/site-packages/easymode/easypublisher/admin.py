@@ -0,0 +1,658 @@
+import collections
+import functools
+import re
+
+from django import template
+from django.conf import settings
+from django.conf.urls.defaults import patterns, url
+from django.shortcuts import get_object_or_404, render_to_response
+from django.utils.translation import ugettext as _
+from django.utils.translation import get_language
+from django.forms.formsets import all_valid
+from django.db import transaction
+from django.http import HttpResponseRedirect
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.admin import helpers
+from django.core.urlresolvers import reverse
+from django.utils.html import mark_safe
+from django.utils.encoding import force_unicode
+from django.utils.functional import cached_property
+from django.utils.dateformat import format
+
+from reversion.admin import VersionAdmin
+from reversion.revisions import Version, Revision
+import reversion
+
+from easymode.easypublisher.models import EasyPublisherMetaData, EasyPublisherModel
+from easymode.tree.admin.relation import ForeignKeyAwareModelAdmin, InvisibleModelAdmin
+
+__all__ = ('EasyPublisher', 'EasyPublisherInvisibleModelAdmin', 'EasyPublisherFKAModelAdmin')
+
+def _eq(self, obj):
+    "Helper to have proper equality for models"
+    cls = self.__class__
+    field_names = cls.__dict__.get('_eq_field_names')
+    if field_names is None:
+        field_names = cls._eq_field_names = tuple(field.name for field in cls._meta.fields)
+
+    if not field_names:
+        raise Exception("%s has no fields or hides them very well" % self)
+
+    for name in field_names:
+        try:
+            if getattr(self, name) != getattr(obj, name):
+                return False
+        except AttributeError:
+            return False
+
+    return True
+
+def _hash(self):
+    "Helper to go with _eq, hashing on the primary key like the default model"
+    return hash(self.pk)
+
+# classes that already had _eq/_hash installed by save_formset
+_PATCHED_CLASSES = set()
+
+# ModelForm classes built by get_form, keyed by admin class, model and the
+# readonly fields of the request. Building one runs modelform_factory, which
+# introspects every field; the result can be reused between renders.
+_FORM_CLASS_CACHE = {}
+
+class EasyPublisher(VersionAdmin):
+    """
+    An admin class that adds approval functionality to the django admin.
+    
+    Drafts will be saved as revisions using reversion.
+    """
+    
+    object_history_template = "easymode/easypublisher/object_history.html"
+    revision_form_template = "easymode/easypublisher/publish_form.html"
+    change_form_template = 'easymode/easypublisher/change_form.html'
+    
+    def get_urls(self):
+        """The urls for the publisher"""
+        urls = super(EasyPublisher, self).get_urls()
+        admin_site = self.admin_site
+        opts = self.model._meta
+        info = opts.app_label, opts.module_name,
+        
+        easy_publisher_urls = patterns("",
+            url(r"^([^/]+)/drafts/$", admin_site.admin_view(self.drafts_view), name='%s_%s_draftlist' % info),
+            url(r"^([^/]+)/drafts/([^/]+)/", admin_site.admin_view(self.publish_view), name='%s_%s_draft' % info),
+            url(r"^(.+)/current/$", admin_site.admin_view(self.change_view), {'extra_context':{'current':True}}, name='%s_%s_current' % info)
+        )
+
+        return easy_publisher_urls + urls
+            
+    def drafts_view(self, request, object_id, extra_context=None):
+        """Renders the drafts view, listing all drafts"""
+        # the template only needs the revisions; fetch the (object_id,
+        # revision_id) pairs without hydrating Version objects and get the
+        # revisions with their users in one extra query.
+        versions = self.get_draft_versions(object_id).values_list('object_id', 'revision_id')
+        revisions = Revision.objects.select_related('user').in_bulk(
+            [revision_id for _object_id, revision_id in versions])
+        action_list = [{"revision": revisions[revision_id],
+                        "url": self._reverse_admin('draft', version_object_id, revision_id)}
+                       for version_object_id, revision_id in versions]
+        context = {
+            "action_list": action_list, 
+            "title": _("Unpublished items"), 
+            'draft_view':True, 
+            'has_draft':self.has_draft(object_id)
+        }
+        context.update(extra_context or {})
+        return super(EasyPublisher, self).history_view(request, object_id, context)
+    
+    def history_view(self, request, object_id, extra_context=None):
+        """Renders the history view, shows the drafts button, but hides the history button"""
+        defaults = {
+            'has_draft': self.has_draft(object_id)
+        }
+        defaults.update(extra_context or {})
+        return super(EasyPublisher, self).history_view(request, object_id, defaults)
+    
+    def change_view(self, request, object_id, extra_context=None):
+        """Renders the normal editing view, which does not display a draft"""
+
+        latest_draft = self.get_latest_draft(object_id)
+        has_publish_perm = self._can_publish(request)
+        context = extra_context or {}
+
+        if latest_draft:
+            context['has_draft'] = latest_draft.pk
+            
+            if not context.get('current', False):
+            
+                if not has_publish_perm:                
+                    return HttpResponseRedirect('drafts/%s/' % latest_draft.pk)
+        
+        return super(EasyPublisher, self).change_view(request, object_id, context)
+        
+    @transaction.commit_on_success
+    @reversion.revision.create_on_success
+    def publish_view(self, request, object_id, revision_id, extra_context=None):
+        """
+        Displays a draft.
+        If you have publishing right, the save button will publish the draft.
+        If you don't it will just create another draft.
+        """
+        
+        obj = get_object_or_404(self.model, pk=object_id)
+        # fetch the revision and its metadata along with the version; the
+        # language check below and update_draft both read the metadata set,
+        # so it should not be queried twice.
+        version = get_object_or_404(
+            Version.objects.select_related('revision').prefetch_related(
+                'revision__easypublishermetadata_set'),
+            revision=revision_id,
+            object_id=force_unicode(obj.pk),
+            content_type=self._content_type)
+
+        if not any(metadata.language == request.LANGUAGE_CODE
+                   for metadata in version.revision.easypublishermetadata_set.all()):
+            request.user.message_set.create(message=_("There is no draft available for language %s") % request.LANGUAGE_CODE)
+            return HttpResponseRedirect('../../current')
+        
+        # Generate the context.
+        context = {
+            "title": _("Publish %(name)s") % {"name": self.model._meta.verbose_name},
+            "publish":True,
+            'has_draft':True,
+            'link_current':True,
+            'extra':0,
+            'revision_id': revision_id,
+        }
+        context.update(extra_context or {})
+        return self.render_revision_form(request, obj, version, context, revert=True)
+            
+    def save_model(self, request, obj, form, change):
+        """
+        Saves the model if you have publishing right, but only makes
+        a draft in reversion if you don't
+        """
+        if self._can_publish(request):
+            obj.save()
+        else:
+            reversion.revision.add_meta(EasyPublisherMetaData, status='draft', language=request.LANGUAGE_CODE)
+            reversion.revision.comment = "Draft"
+
+            if not change and hasattr(obj, 'published'):
+                obj.published = False
+                obj.save()
+                obj.published = True
+            
+            reversion.revision.post_save_receiver(obj, 0)
+                
+
+    def save_formset(self, request, form, formset, change):
+        """
+        Saves the formset if you have publishing right, but only makes
+        a draft in reversion if you don't
+        """
+
+        if self._can_publish(request):
+            formset.save()
+        else:
+            reversion.revision.add_meta(EasyPublisherMetaData, status='draft', language=request.LANGUAGE_CODE)
+            instances = formset.save(commit=False)
+            
+            for instance in instances:
+                if instance.pk is None:
+                    # reversion puts these models in a set(). If we don't define
+                    # proper equality for them, they will all count as equal, since
+                    # their id's are all the same. This only has to be done once
+                    # for every type of object.
+                    cls = instance.__class__
+                    if cls not in _PATCHED_CLASSES:
+                        cls.__eq__ = _eq
+                        cls.__hash__ = _hash
+                        _PATCHED_CLASSES.add(cls)
+                reversion.revision.post_save_receiver(instance, 0)
+            
+    @cached_property
+    def _content_type(self):
+        """The content type of the model, resolved once per admin instance"""
+        return ContentType.objects.get_for_model(self.model)
+
+    def _can_publish(self, request):
+        """Whether request.user may approve publications, cached on the request"""
+        can_publish = getattr(request, '_ep_can_publish', None)
+        if can_publish is None:
+            can_publish = request._ep_can_publish = request.user.has_perm(
+                "easypublisher.can_approve_for_publication")
+        return can_publish
+
+    def _reverse_admin(self, suffix, *args):
+        """Reverse an admin view url of this model by its url name suffix"""
+        opts = self.model._meta
+        return reverse("admin:%s_%s_%s" % (opts.app_label, opts.module_name, suffix), args=args)
+
+    @cached_property
+    def _changelist_url(self):
+        """The changelist url, reversed only once per admin instance"""
+        return self._reverse_admin('changelist')
+
+    @cached_property
+    def _recoverlist_url(self):
+        """The recoverlist url, reversed only once per admin instance"""
+        return self._reverse_admin('recoverlist')
+
+    def has_draft(self, object_id):
+        """Find out if there is a draft version of this model"""
+        return self.get_draft_revisions(object_id).exists()
+
+    def get_draft_revisions(self, object_id):
+        """
+        retrieve all revision marked as draft that belong to object_id.
+        """
+        # subquery filters instead of joins, so no DISTINCT is needed to
+        # collapse duplicated join rows
+        return Revision.objects.filter(
+            pk__in=Version.objects.filter(
+                object_id=object_id,
+                content_type=self._content_type
+            ).values('revision_id')
+        ).filter(
+            pk__in=EasyPublisherMetaData.objects.filter(
+                status='draft',
+                language=get_language()
+            ).values('revision_id')
+        ).only('id', 'date_created')
+
+    def get_draft_versions(self, object_id):
+        """
+        Retrieve all drafts that belong to this item
+        """
+        versions = Version.objects.filter(
+            revision_id__in=Revision.objects.filter(
+                easypublishermetadata__status='draft',
+                easypublishermetadata__language=get_language()
+            ).values('pk'),
+            object_id=object_id,
+            content_type=self._content_type
+        ).select_related('revision').only(
+            # listing drafts never needs serialized_data, which dwarfs
+            # every other column of the version table
+            'pk', 'object_id', 'revision_id', 'content_type_id',
+            'revision__date_created'
+        )
+
+        return versions
+
+    def get_latest_draft_revision(self, object_id):
+        """
+        Retrieve latest draft revision that belongs to object_id.
+        """
+        return self.get_draft_revisions(object_id).order_by('-date_created').first()
+    
+    def get_latest_draft(self, object_id):
+        """
+        Retrieves the latest draft that belongs to object_id.
+        """
+        return self.get_latest_draft_revision(object_id)
+    
+    def update_draft(self, version, request):
+        """Update the status of the draft belonging to this version"""
+        for metadata in version.revision.easypublishermetadata_set.all():
+            if self._can_publish(request):
+                metadata.status = 'published'
+                # decline all other drafts for this object in a single
+                # UPDATE, because we chose to publish a different one
+                EasyPublisherMetaData.objects.filter(
+                    revision__version__object_id=version.object_id,
+                    revision__version__content_type=version.content_type
+                ).exclude(pk=metadata.pk).update(status='declined')
+            else:
+                metadata.status = 'updated'
+            metadata.save(update_fields=['status'])
+        
+    
+    ##     ##    ###    ##     ## 
+    ##     ##   ## ##    ##   ##  
+    ##     ##  ##   ##    ## ##   
+    ######### ##     ##    ###    
+    ##     ## #########   ## ##   
+    ##     ## ##     ##  ##   ##  
+    ##     ## ##     ## ##     ## 
+    # this is copy pasted because reversion does not let us do anything with the 
+    # messages that go after the you know what.
+    # please remove this if nolonger needed
+    def render_revision_form(self, request, obj, version, context, revert=False, recover=False):
+        """Renders the object revision form."""
+        model = self.model
+        opts = model._meta
+        object_id = obj.pk
+        # Resolve the publish permission once; save_model, save_formset and
+        # update_draft all reuse the cached value below.
+        self._can_publish(request)
+        # Generate the model form, reusing a cached class when this admin has
+        # already built one for the same field configuration.
+        form_cache_key = (type(self), self.model,
+                          tuple(self.get_readonly_fields(request, obj)))
+        ModelForm = _FORM_CLASS_CACHE.get(form_cache_key)
+        if ModelForm is None:
+            ModelForm = _FORM_CLASS_CACHE[form_cache_key] = self.get_form(request, obj)
+        formsets = []
+        if request.method == "POST":
+            # This section is copied directly from the model admin change view
+            # method.  Maybe one day there will be a hook for doing this better.
+            form = ModelForm(request.POST, request.FILES, instance=obj, initial=self.get_revision_form_data(request, obj, version))
+            if form.is_valid():
+                form_validated = True
+                new_object = self.save_form(request, form, change=True)
+            else:
+                form_validated = False
+                new_object = obj
+            prefixes = {}
+            for FormSet, inline in zip(self.get_formsets(request, new_object),
+                                       self.inline_instances):
+                prefix = FormSet.get_default_prefix()
+                prefixes[prefix] = prefixes.get(prefix, 0) + 1
+                if prefixes[prefix] != 1:
+                    prefix = "%s-%s" % (prefix, prefixes[prefix])
+                
+                formset = FormSet(request.POST, request.FILES,
+                                  instance=new_object, prefix=prefix,
+                                  queryset=inline.queryset(request))
+                formsets.append(formset)
+
+            # _ _ _ ____ ___ ____ _  _    ____ _  _ ___
+            # | | | |__|  |  |    |__|    |  | |  |  |
+            # |_|_| |  |  |  |___ |  |    |__| |__|  |
+            # this is not copy pasted:
+            # Strip extra empty forms from the formsets.
+            # the forms that can be removed, are not in the request.POST.
+            # one compiled-regex pass over the POST (iterated, never
+            # materialized via .keys()) collects the prefixes of the forms of
+            # all formsets at once, so each form is a set lookup below.
+            prefix_re = re.compile(r'^(%s)-' % '|'.join(
+                re.escape(f.prefix) for formset in formsets for f in formset.forms))
+            present_prefixes = set()
+            for key in request.POST:
+                match = prefix_re.match(key)
+                if match:
+                    present_prefixes.add(match.group(1))
+            for formset in formsets:
+                empty_forms = []
+                for f in formset.forms:
+                    if f.prefix not in present_prefixes:
+                        empty_forms.append(f)
+                    elif form_validated:
+                        # the form must be cleaned, which they aren't yet because
+                        # we just created them. When the main form is already
+                        # invalid nothing will be saved, so the formsets are
+                        # only redisplayed and can clean themselves lazily.
+                        f.full_clean()
+
+                # modify form settings of formset.
+                num_forms = formset.total_form_count() - len(empty_forms)
+                empty_set = set(map(id, empty_forms))
+                formset.forms = [f for f in formset.forms if id(f) not in empty_set]
+                formset.total_form_count = lambda num_forms=num_forms: num_forms
+            # end of non copy pasted piece
+            if form_validated and all_valid(formsets):
+                self.save_model(request, new_object, form, change=True)
+                form.save_m2m()
+                for formset in formsets:
+                    self.save_formset(request, form, formset, change=True)
+                
+                # _ _ _ ____ ___ ____ _  _    ____ _  _ ___ 
+                # | | | |__|  |  |    |__|    |  | |  |  |  
+                # |_|_| |  |  |  |___ |  |    |__| |__|  |
+                # this is not copy pasted:
+                self.update_draft(version, request)
+                
+                change_message = _(u"Publisher message %(datetime)s") % {"datetime": format(version.revision.date_created, _(settings.DATETIME_FORMAT))}
+                self.log_change(request, new_object, change_message)
+                self.message_user(request, _(u'%(model)s "%(name)s" publisher message.') % {"model": force_unicode(opts.verbose_name), "name": unicode(obj)})
+
+                # end of not copy pasted code
+
+                # Redirect to the model change form.
+                if revert:
+                    return HttpResponseRedirect("../../")
+                elif recover:
+                    return HttpResponseRedirect("../../%s/" % object_id)
+                else:
+                    assert False
+        else:
+            # This is a mutated version of the code in the standard model admin
+            # change_view.  Once again, a hook for this kind of functionality
+            # would be nice.  Unfortunately, it results in doubling the number
+            # of queries required to construct the formets.
+            form = ModelForm(instance=obj, initial=self.get_revision_form_data(request, obj, version))
+            prefixes = {}
+            # Resolve the content types of all inline models in one call, so
+            # the loop below never goes through the ContentType manager.
+            inline_formsets = list(zip(self.get_formsets(request, obj), self.inline_instances))
+            cts_by_model = ContentType.objects.get_for_models(
+                *[FormSet.model for FormSet, inline in inline_formsets])
+            # Only versions of the inline models matter here; narrow them in
+            # the database so the serialized data of unrelated versions (the
+            # parent object itself, for one) is never fetched or parsed.
+            revision_versions = version.revision.version_set.filter(
+                content_type_id__in=[ct.id for ct in cts_by_model.values()])
+            # Index the versions by content type once, so every formset below
+            # can grab its candidates with a single dict lookup instead of
+            # resolving the content type of every version again.
+            versions_by_ct = collections.defaultdict(list)
+            for related_version in revision_versions:
+                versions_by_ct[related_version.content_type_id].append(related_version)
+            object_id_text = unicode(object_id)
+            for FormSet, inline in inline_formsets:
+                # This code is standard for creating the formset.
+                prefix = FormSet.get_default_prefix()
+                prefixes[prefix] = prefixes.get(prefix, 0) + 1
+                if prefixes[prefix] != 1:
+                    prefix = "%s-%s" % (prefix, prefixes[prefix])
+                # Evaluate the inline queryset once; priming its result cache
+                # lets both the formset construction and the loop over the
+                # related objects below reuse the same SELECT.
+                inline_queryset = inline.queryset(request)
+                related_objects = list(inline_queryset)
+                formset = FormSet(instance=obj, prefix=prefix,
+                                  queryset=inline_queryset)
+                # Now we hack it to push in the data from the revision!
+                try:
+                    fk_name = FormSet.fk.name
+                except AttributeError:
+                    # This is a GenericInlineFormset, or similar.
+                    fk_name = FormSet.ct_fk_field.name
+                
+                # _ _ _ ____ ___ ____ _  _    ____ _  _ ___ 
+                # | | | |__|  |  |    |__|    |  | |  |  |  
+                # |_|_| |  |  |  |___ |  |    |__| |__|  |
+                # this is not copy pasted:
+                fs_ct_id = cts_by_model[FormSet.model].id
+                # all items that do not have their id filled in must stay.
+                # if they do in fact have an id, we only want the last one,
+                # no duplicates.
+                related_versions = []
+                deduplicated = {}
+                for related_version in versions_by_ct.get(fs_ct_id, ()):
+                    if unicode(related_version.field_dict[fk_name]) != object_id_text:
+                        continue
+                    if related_version.object_id == 'None':
+                        related_versions.append((related_version.object_id, related_version))
+                    else:
+                        deduplicated[related_version.object_id] = related_version
+                related_versions.extend(deduplicated.items())
+                
+                # model_to_dict re-introspects _meta for every row; resolve
+                # the editable fields once per formset and read the values
+                # directly.
+                model_opts = FormSet.model._meta
+                initial_fields = [field for field in model_opts.fields + model_opts.many_to_many
+                                  if field.editable]
+                # the pk -> version mapping is the same for every row; build
+                # it once per formset instead of once per related object
+                related_versions_dict = dict(deduplicated)
+                initial = []
+                for related_obj in related_objects:
+                    related_pk = unicode(related_obj.pk)
+                    if related_pk in related_versions_dict:
+                        initial.append(related_versions_dict.pop(related_pk).field_dict)
+                    else:
+                        initial_data = dict((field.name, field.value_from_object(related_obj))
+                                            for field in initial_fields)
+                        initial_data["DELETE"] = True
+                        initial.append(initial_data)
+                for (key, related_version) in related_versions:
+                    initial_row = related_version.field_dict
+                    try:
+                        del initial_row["id"]
+                    except KeyError:
+                        # when multiple inlines with the same model but a different
+                        # querysets are on a page, it could happen that we allready
+                        # deleted the id.
+                        pass
+                    
+                    # we didn't convert related_versions to a dict so there can be
+                    # duplicate keys in the thingy
+                    if not initial_row in initial:
+                        initial.append(initial_row)
+                
+                # end of non copy pasted piece
+                
+                # Reconstruct the forms with the new revision data.
+                formset.initial = initial
+                formset.forms = [formset._construct_form(n) for n in xrange(len(initial))]
+                # Add this hacked formset to the form.
+                formsets.append(formset)
+        # Generate admin form helper.
+        adminForm = helpers.AdminForm(form, self.get_fieldsets(request, obj),
+            self.prepopulated_fields, self.get_readonly_fields(request, obj),
+            model_admin=self)
+        media = self.media + adminForm.media
+        # Generate formset helpers.
+        inline_admin_formsets = []
+        for inline, formset in zip(self.inline_instances, formsets):
+            fieldsets = list(inline.get_fieldsets(request, obj))
+            readonly = list(inline.get_readonly_fields(request, obj))
+            inline_admin_formset = helpers.InlineAdminFormSet(inline, formset,
+                fieldsets, readonly, model_admin=self)
+            inline_admin_formsets.append(inline_admin_formset)
+            media = media + inline_admin_formset.media
+        # Generate the context.
+        context.update({"adminform": adminForm,
+                        "object_id": object_id,
+                        "original": obj,
+                        "is_popup": False,
+                        "media": mark_safe(media),
+                        "inline_admin_formsets": inline_admin_formsets,
+                        "errors": helpers.AdminErrorList(form, formsets),
+                        "app_label": opts.app_label,
+                        "add": False,
+                        "change": True,
+                        "has_add_permission": self.has_add_permission(request),
+                        "has_change_permission": self.has_change_permission(request, obj),
+                        "has_delete_permission": self.has_delete_permission(request, obj),
+                        "has_file_field": True,
+                        "has_absolute_url": getattr(self.model, 'get_absolute_url', False),
+                        "ordered_objects": opts.get_ordered_objects(),
+                        "form_url": mark_safe(request.path),
+                        "opts": opts,
+                        "content_type_id": ContentType.objects.get_for_model(self.model).id,
+                        "save_as": False,
+                        "save_on_top": self.save_on_top,
+                        "changelist_url": self._changelist_url,
+                        "change_url": self._reverse_admin('change', obj.pk),
+                        "history_url": self._reverse_admin('history', obj.pk),
+                        "recoverlist_url": self._recoverlist_url})
+        
+        # Render the form.
+        if revert:
+            form_template = self.revision_form_template
+        elif recover:
+            form_template = self.recover_form_template
+        else:
+            assert False
+        return render_to_response(form_template, context, template.RequestContext(request))
+
+def _add_foreign_key_aware_model_admin_behaviour(method):
+    """
+    Is used to add some stuff of ForeignKeyAwareModelAdmin to
+    EasyPublisher views.
+    """
+    @functools.wraps(method)
+    def altered_view(self, request, object_id, extra_context=None):
+        inline_links = {}
+        inline_links['extra_forms'] = self.extra_forms(object_id)
+
+        # retrieve link to parent for breadcrumb path
+        inline_links.update(self._get_parent_link(object_id))
+        if extra_context:
+            inline_links.update(extra_context)
+        
+        return method(self, request, object_id, inline_links)
+    
+    return altered_view
+
+class EasyPublisherFKAModelAdmin(EasyPublisher, ForeignKeyAwareModelAdmin):
+    """fixes the collision between EasyPublisher, ForeignKeyAwareModelAdmin"""
+
+    change_form_template = 'easymode/easypublisher/change_form_with_related_links.html'
+    revision_form_template = 'easymode/easypublisher/publish_form_with_related_links.html'
+    def get_model_perms(self, request):
+        perms = super(EasyPublisherFKAModelAdmin, self).get_model_perms(request)
+        perms['invisible_in_admin'] = self.invisible_in_admin
+        return perms
+    
+    def publish_view(self, request, object_id, version_id, extra_context=None):
+        inline_links = {}
+        inline_links['extra_forms'] = self.extra_forms(object_id)
+
+        # retrieve link to parent for breadcrumb path
+        inline_links.update(self._get_parent_link(object_id))
+        if extra_context:
+            inline_links.update(extra_context)
+            
+        return EasyPublisher.publish_view(self, request, object_id, version_id, inline_links)
+        
+    change_view = _add_foreign_key_aware_model_admin_behaviour(EasyPublisher.change_view)
+    drafts_view = _add_foreign_key_aware_model_admin_behaviour(EasyPublisher.drafts_view)
+    history_view = _add_foreign_key_aware_model_admin_behaviour(EasyPublisher.history_view)
+
+def _add_invisible_model_admin_behaviour(method):
+    """
+    Is used to add some stuff of InvisibleModelAdmin to
+    EasyPublisher views.
+    """
+    @functools.wraps(method)
+    def altered_view(self, request, object_id, extra_context=None):
+        # retrieve link to parent for breadcrumb path
+        defaults = self._get_parent_link(object_id)
+
+        if extra_context:
+            defaults.update(extra_context)
+    
+        return method(self, request, object_id, defaults)
+    
+    return altered_view
+
+class EasyPublisherInvisibleModelAdmin(EasyPublisher, InvisibleModelAdmin):
+    """
+    fixes the collision between EasyPublisher and InvisibleModelAdmin
+    
+    see :mod:`easymode.tree.admin.relation`
+    """
+        
+    def get_model_perms(self, request):
+        perms = super(EasyPublisherInvisibleModelAdmin, self).get_model_perms(request)
+        perms['invisible_in_admin'] = self.invisible_in_admin
+        return perms
+    
+    def publish_view(self, request, object_id, version_id, extra_context=None):
+        """docstring for publish_view"""
+        defaults = self._get_parent_link(object_id)
+
+        if extra_context:
+            defaults.update(extra_context)
+            
+        return EasyPublisher.publish_view(self, request, object_id, version_id, defaults)      
+         
+    change_view = _add_invisible_model_admin_behaviour(EasyPublisher.change_view)
+    drafts_view = _add_invisible_model_admin_behaviour(EasyPublisher.drafts_view)
+    history_view = _add_invisible_model_admin_behaviour(EasyPublisher.history_view)